@@ -0,0 +1,78 @@
+/*
+ * Sistema de EDOs e integrador Velocity-Verlet en C.
+ *
+ * Alternativa a Numba sin tiempo de compilación JIT al arrancar: el bucle
+ * de integración completo se ejecuta en C, sin pasar por Python en cada
+ * paso. Compilar como biblioteca compartida junto a sistema_masa_resorte.py:
+ *
+ *     cc -O3 -shared -fPIC -o libecuaciones.so ecuaciones.c
+ *
+ * sistema_masa_resorte la carga con ctypes si existe.
+ */
+
+#include <stddef.h>
+
+typedef struct {
+    double k1, k2, L1, L2;
+    double peso1, peso2;    /* m1*g, m2*g */
+    double inv_m1, inv_m2;  /* 1/m1, 1/m2 */
+} parametros_t;
+
+/* Permite comprobar desde Python que la estructura coincide. */
+size_t tamano_parametros(void)
+{
+    return sizeof(parametros_t);
+}
+
+/* Escribe [v1, a1, v2, a2] en dydt para el estado y = [x1, v1, x2, v2]. */
+int rhs(double t, const double *y, double *dydt, void *params)
+{
+    const parametros_t *p = (const parametros_t *) params;
+    double x1 = y[0];
+    double x2 = y[2];
+    (void) t;
+
+    /* Fuerza del resorte 2 sobre la masa 1; sobre la masa 2 es la opuesta */
+    double acoplamiento = p->k2 * (x2 - x1 - p->L2);
+
+    dydt[0] = y[1];
+    dydt[1] = (-p->k1 * (x1 - p->L1) + acoplamiento + p->peso1) * p->inv_m1;
+    dydt[2] = y[3];
+    dydt[3] = (-acoplamiento + p->peso2) * p->inv_m2;
+    return 0;
+}
+
+/*
+ * Integra con Velocity-Verlet sobre los n instantes de t, con el mismo
+ * esquema que _verlet en Python. out es una matriz n x 4 por filas.
+ */
+void integrar_verlet(const double *y0, const double *t, long n,
+                     const parametros_t *p, double *out)
+{
+    double y[4] = {y0[0], y0[1], y0[2], y0[3]};
+    double dydt[4];
+    long i;
+    int j;
+
+    if (n <= 0)
+        return;
+
+    rhs(t[0], y, dydt, (void *) p);
+    for (j = 0; j < 4; j++)
+        out[j] = y[j];
+
+    for (i = 1; i < n; i++) {
+        double dt = t[i] - t[i - 1];
+        /* Medio impulso, deriva y segundo medio impulso */
+        y[1] += 0.5 * dt * dydt[1];
+        y[3] += 0.5 * dt * dydt[3];
+        y[0] += dt * y[1];
+        y[2] += dt * y[3];
+        rhs(t[i], y, dydt, (void *) p);
+        y[1] += 0.5 * dt * dydt[1];
+        y[3] += 0.5 * dt * dydt[3];
+
+        for (j = 0; j < 4; j++)
+            out[4 * i + j] = y[j];
+    }
+}
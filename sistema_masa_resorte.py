@@ -18,14 +18,334 @@ donde:
 - g: aceleración gravitacional
 """
 
+import ctypes
+import os
+import sys
+from collections import namedtuple
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import odeint
+import matplotlib
+from scipy.integrate import ode, odeint
+from scipy.linalg import eigh
+
+# Sin servidor gráfico (p. ej. en CI) el ejemplo usa Agg y no abre ventana.
+# El backend se elige antes de importar pyplot; Windows y macOS siempre
+# tienen uno nativo, y MPLBACKEND, si está definida, tiene prioridad.
+_SIN_PANTALLA = (sys.platform not in ('win32', 'darwin')
+                 and not os.environ.get('DISPLAY')
+                 and not os.environ.get('WAYLAND_DISPLAY'))
+if __name__ == "__main__" and _SIN_PANTALLA and not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él se usa Python puro
+    def njit(*args, **kwargs):
+        """Sustituto de ``numba.njit`` que devuelve la función sin compilar."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcion: funcion
+    
+    prange = range
+
+
+@njit(cache=True, fastmath=True)
+def _ecuaciones_jit(y, t, k1, k2, L1, L2, peso1, peso2, inv_m1, inv_m2, out):
+    """
+    Lado derecho del sistema de EDOs, compilado con Numba.
+    
+    Se define fuera de la clase para que Numba pueda compilarla
+    (no admite ``self``) y se le pasan los parámetros explícitamente
+    a través de ``args`` de ``odeint``. Los pesos (m*g) y los inversos de
+    las masas llegan precalculados para evitar repetir productos y
+    divisiones en cada evaluación. Las derivadas se escriben en el
+    buffer ``out``, que se reutiliza entre llamadas para no reservar
+    memoria en cada evaluación; ``odeint`` copia el resultado, por lo
+    que reutilizarlo es seguro.
+    """
+    x1 = y[0]
+    v1 = y[1]
+    x2 = y[2]
+    v2 = y[3]
+    
+    # Fuerza del resorte 2 sobre la masa 1 (hacia abajo si x2 > x1 + L2);
+    # sobre la masa 2 actúa la misma fuerza con signo contrario
+    acoplamiento = k2 * (x2 - x1 - L2)
+    
+    # Aceleración masa 1: resorte 1 (hacia arriba si estirado),
+    # resorte 2 y gravedad
+    a1 = (-k1 * (x1 - L1) + acoplamiento + peso1) * inv_m1
+    
+    # Aceleración masa 2: resorte 2 y gravedad
+    a2 = (-acoplamiento + peso2) * inv_m2
+    
+    out[0] = v1
+    out[1] = a1
+    out[2] = v2
+    out[3] = a2
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _ecuaciones_batch_jit(Y, t, k1, k2, L1, L2, peso1, peso2, inv_m1, inv_m2, out):
+    """
+    Lado derecho para N sistemas independientes integrados a la vez.
+    
+    ``Y`` y ``out`` son vectores de longitud 4N que se ven como matrices
+    (N, 4) con filas [x1, v1, x2, v2]; las aceleraciones de los N sistemas
+    se calculan con operaciones vectoriales sobre las columnas.
+    """
+    estados = Y.reshape((-1, 4))
+    derivadas = out.reshape((-1, 4))
+    x1 = estados[:, 0]
+    x2 = estados[:, 2]
+    
+    # Fuerza del resorte 2 sobre la masa 1; sobre la masa 2 es la opuesta
+    acoplamiento = k2 * (x2 - x1 - L2)
+    
+    derivadas[:, 0] = estados[:, 1]
+    derivadas[:, 1] = (-k1 * (x1 - L1) + acoplamiento + peso1) * inv_m1
+    derivadas[:, 2] = estados[:, 3]
+    derivadas[:, 3] = (-acoplamiento + peso2) * inv_m2
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _aceleraciones(x1, x2, k1, k2, L1, L2, peso1, peso2, inv_m1, inv_m2):
+    """Aceleraciones (a1, a2) de las masas para las posiciones dadas."""
+    acoplamiento = k2 * (x2 - x1 - L2)
+    a1 = (-k1 * (x1 - L1) + acoplamiento + peso1) * inv_m1
+    a2 = (-acoplamiento + peso2) * inv_m2
+    return a1, a2
+
+
+@njit(cache=True, fastmath=True)
+def _verlet(y0, t, k1, k2, L1, L2, peso1, peso2, inv_m1, inv_m2, out):
+    """
+    Integra el sistema con Velocity-Verlet de paso fijo.
+    
+    El paso es la separación entre instantes consecutivos de ``t`` y el
+    estado en cada instante se escribe en la fila correspondiente de
+    ``out`` (matriz (len(t), 4) con columnas [x1, v1, x2, v2]). Al ser un
+    integrador simpléctico, la energía no deriva en simulaciones largas.
+    """
+    # Numba no comprueba límites: con t vacío no hay fila 0 que escribir
+    if t.shape[0] == 0:
+        return out
+    x1 = y0[0]
+    v1 = y0[1]
+    x2 = y0[2]
+    v2 = y0[3]
+    a1, a2 = _aceleraciones(x1, x2, k1, k2, L1, L2,
+                            peso1, peso2, inv_m1, inv_m2)
+    
+    out[0, 0] = x1
+    out[0, 1] = v1
+    out[0, 2] = x2
+    out[0, 3] = v2
+    for i in range(1, t.shape[0]):
+        dt = t[i] - t[i - 1]
+        # Medio impulso, deriva y segundo medio impulso
+        v1 += 0.5 * dt * a1
+        v2 += 0.5 * dt * a2
+        x1 += dt * v1
+        x2 += dt * v2
+        a1, a2 = _aceleraciones(x1, x2, k1, k2, L1, L2,
+                                peso1, peso2, inv_m1, inv_m2)
+        v1 += 0.5 * dt * a1
+        v2 += 0.5 * dt * a2
+        
+        out[i, 0] = x1
+        out[i, 1] = v1
+        out[i, 2] = x2
+        out[i, 3] = v2
+    return out
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _barrido_verlet(parametros, condiciones_iniciales, t, g, out):
+    """
+    Aplica ``_verlet`` a cada fila de ``parametros`` en paralelo.
+    
+    Los sistemas son independientes, así que ``prange`` reparte las filas
+    entre los núcleos disponibles. Cada uno escribe en su propio bloque
+    contiguo ``out[i]`` de forma (len(t), 4).
+    """
+    for i in prange(parametros.shape[0]):
+        m1 = parametros[i, 0]
+        m2 = parametros[i, 1]
+        k1 = parametros[i, 2]
+        k2 = parametros[i, 3]
+        L1 = parametros[i, 4]
+        L2 = parametros[i, 5]
+        _verlet(condiciones_iniciales[i], t, k1, k2, L1, L2,
+                m1 * g, m2 * g, 1.0 / m1, 1.0 / m2, out[i])
+    return out
+
+
+def barrido_parametros(parametros, condiciones_iniciales, t_inicial=0, t_final=10,
+                       num_puntos=1000, g=9.8, dtype=np.float64):
+    """
+    Simula N sistemas con parámetros distintos usando Velocity-Verlet.
+    
+    Pensado para explorar el espacio de diseño: con Numba los sistemas se
+    integran en paralelo, uno por hilo. Como en ``simular(metodo='verlet')``,
+    el paso es la separación entre puntos de evaluación.
+    
+    Parameters
+    ----------
+    parametros : array
+        Matriz (N, 6) con filas (m1, m2, k1, k2, L1, L2)
+    condiciones_iniciales : array
+        Matriz (N, 4) con filas (x1_0, v1_0, x2_0, v2_0)
+    t_inicial : float, optional
+        Tiempo inicial (default: 0)
+    t_final : float, optional
+        Tiempo final (default: 10 segundos)
+    num_puntos : int, optional
+        Número de puntos de evaluación (default: 1000)
+    g : float, optional
+        Aceleración gravitacional (m/s²), default es 9.8
+    dtype : data-type, optional
+        Tipo de los datos devueltos, como en ``SistemaMasaResorte.simular``
+        (default: np.float64)
+    
+    Returns
+    -------
+    tuple
+        (t, solucion) - array de tiempos y array (N, num_puntos, 4) con
+        [x1, v1, x2, v2] de cada sistema
+    """
+    parametros = np.ascontiguousarray(parametros, dtype=float)
+    ics = np.ascontiguousarray(condiciones_iniciales, dtype=float)
+    if parametros.ndim != 2 or parametros.shape[1] != 6 or parametros.shape[0] == 0:
+        raise ValueError("parametros debe tener forma (N, 6) con N > 0")
+    if ics.shape != (parametros.shape[0], 4):
+        raise ValueError("condiciones_iniciales debe tener forma (N, 4)")
+    if num_puntos < 1:
+        raise ValueError("num_puntos debe ser al menos 1")
+    
+    t = np.linspace(t_inicial, t_final, num_puntos)
+    solucion = _barrido_verlet(parametros, ics, t, float(g),
+                               np.empty((parametros.shape[0], num_puntos, 4)))
+    return t, solucion.astype(dtype, copy=False)
+
+
+# Lado derecho usado por los integradores: la extensión Cython si está
+# compilada, si no la versión de Numba (o Python puro sin Numba)
+try:
+    from sistema_masa_resorte_core import ecuaciones_c as _ecuaciones_rhs
+except ImportError:
+    _ecuaciones_rhs = _ecuaciones_jit
+
+
+class _ParametrosC(ctypes.Structure):
+    """Espejo de ``parametros_t`` en ecuaciones.c."""
+    _fields_ = [(nombre, ctypes.c_double) for nombre in
+                ('k1', 'k2', 'L1', 'L2', 'peso1', 'peso2', 'inv_m1', 'inv_m2')]
+
+
+def _cargar_libecuaciones():
+    """
+    Carga la biblioteca compilada desde ecuaciones.c, si existe junto a
+    este módulo. Devuelve None si no se ha compilado, si no puede cargarse
+    o si su ``parametros_t`` no coincide con ``_ParametrosC``; en ese caso
+    se usa la versión de Numba.
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    for nombre in ('libecuaciones.so', 'libecuaciones.dylib', 'libecuaciones.dll'):
+        ruta = os.path.join(directorio, nombre)
+        if not os.path.exists(ruta):
+            continue
+        try:
+            libreria = ctypes.CDLL(ruta)
+            puntero = ctypes.POINTER(ctypes.c_double)
+            libreria.integrar_verlet.argtypes = [puntero, puntero, ctypes.c_long,
+                                                 ctypes.POINTER(_ParametrosC), puntero]
+            libreria.integrar_verlet.restype = None
+            tamano = libreria.tamano_parametros
+            tamano.argtypes = []
+            tamano.restype = ctypes.c_size_t
+        except (OSError, AttributeError):
+            # Biblioteca de otra arquitectura, dañada o de otra versión
+            return None
+        if tamano() != ctypes.sizeof(_ParametrosC):
+            return None
+        return libreria
+    return None
+
+
+_libecuaciones = _cargar_libecuaciones()
+
+
+def _verlet_c(y0, t, constantes, out):
+    """Misma interfaz que ``_verlet`` pero ejecutando el bucle en C."""
+    y0 = np.ascontiguousarray(y0, dtype=np.float64)
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    puntero = ctypes.POINTER(ctypes.c_double)
+    _libecuaciones.integrar_verlet(y0.ctypes.data_as(puntero),
+                                   t.ctypes.data_as(puntero), len(t),
+                                   ctypes.byref(_ParametrosC(*constantes)),
+                                   out.ctypes.data_as(puntero))
+    return out
+
+
+def _submuestrear(t, *series, max_puntos=2000):
+    """
+    Reduce por salto fijo los datos a graficar a lo sumo ``max_puntos``.
+    
+    Con más puntos que píxeles de ancho la curva no cambia visualmente,
+    pero el costo de dibujarla crece con el número de puntos.
+    """
+    n = len(t)
+    if n <= max_puntos:
+        return (t,) + series
+    # Se conserva siempre el último punto para no recortar el eje de tiempo
+    paso = -(-(n - 1) // (max_puntos - 1))
+    indices = np.unique(np.r_[0:n:paso, n - 1])
+    return (t[indices],) + tuple(y[indices] for y in series)
+
+
+class ResultadoSimulacion(namedtuple('ResultadoSimulacion', ['t', 'solucion'])):
+    """
+    Resultado de ``SistemaMasaResorte.simular``.
+    
+    ``solucion`` es la matriz contigua (len(t), 4) con columnas
+    [x1, v1, x2, v2], para que los análisis que usan los cuatro canales la
+    recorran en una sola pasada. Las propiedades x1, v1, x2 y v2 devuelven
+    vistas de cada columna, sin copiar datos.
+    """
+    __slots__ = ()
+    
+    @property
+    def x1(self):
+        """Posición de la masa 1."""
+        return self.solucion[:, 0]
+    
+    @property
+    def v1(self):
+        """Velocidad de la masa 1."""
+        return self.solucion[:, 1]
+    
+    @property
+    def x2(self):
+        """Posición de la masa 2."""
+        return self.solucion[:, 2]
+    
+    @property
+    def v2(self):
+        """Velocidad de la masa 2."""
+        return self.solucion[:, 3]
 
 
 class SistemaMasaResorte:
     """Clase para simular un sistema de 2 masas y 2 resortes vertical."""
     
+    # Atributos de los que dependen las constantes de _precalcular()
+    _PARAMETROS = ('m1', 'm2', 'k1', 'k2', 'L1', 'L2', 'g')
+    
     def __init__(self, m1, m2, k1, k2, L1, L2, g=9.8):
         """
         Inicializa el sistema.
@@ -47,6 +367,9 @@ class SistemaMasaResorte:
         g : float, optional
             Aceleración gravitacional (m/s²), default es 9.8
         """
+        # Buffer reutilizado por ecuaciones() para devolver las derivadas
+        self._dydt = np.empty(4)
+        self._inicializado = False
         self.m1 = m1
         self.m2 = m2
         self.k1 = k1
@@ -54,7 +377,45 @@ class SistemaMasaResorte:
         self.L1 = L1
         self.L2 = L2
         self.g = g
+        self._inicializado = True
+        self._precalcular()
+    
+    def __setattr__(self, nombre, valor):
+        # Al cambiar un parámetro se recalculan las constantes derivadas,
+        # para que todos los métodos usen los mismos valores
+        super().__setattr__(nombre, valor)
+        if nombre in self._PARAMETROS and self._inicializado:
+            self._precalcular()
+    
+    def _precalcular(self):
+        """Calcula las constantes que dependen de los parámetros del sistema."""
+        m1, m2, k1, k2 = self.m1, self.m2, self.k1, self.k2
+        L1, L2, g = self.L1, self.L2, self.g
         
+        # Constantes que usan los lados derechos compilados, precalculadas
+        # para no repetir productos y divisiones en cada evaluación
+        self._peso1 = m1 * g
+        self._peso2 = m2 * g
+        self._inv_m1 = 1.0 / m1
+        self._inv_m2 = 1.0 / m2
+        self._constantes = (k1, k2, L1, L2, self._peso1, self._peso2,
+                            self._inv_m1, self._inv_m2)
+        # Jacobiano del sistema: es constante porque las ecuaciones son
+        # lineales en (x1, v1, x2, v2)
+        self._J = np.array([
+            [0.0, 1.0, 0.0, 0.0],
+            [-(k1 + k2) / m1, 0.0, k2 / m1, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+            [k2 / m2, 0.0, -k2 / m2, 0.0],
+        ])
+        # Modos normales: problema generalizado K v = w² M v. Los vectores
+        # propios quedan normalizados de forma que V.T @ M @ V = I
+        self._M = np.diag([m1, m2])
+        K = np.array([[k1 + k2, -k2],
+                      [-k2, k2]])
+        w2, self._V = eigh(K, self._M)
+        self._omega = np.sqrt(w2)
+    
     def ecuaciones(self, y, t):
         """
         Define el sistema de ecuaciones diferenciales de primer orden.
@@ -71,31 +432,20 @@ class SistemaMasaResorte:
         Returns
         -------
         dydt : array
-            Derivadas [dx1/dt, dv1/dt, dx2/dt, dv2/dt]
+            Derivadas [dx1/dt, dv1/dt, dx2/dt, dv2/dt]. El array se
+            reutiliza en cada llamada; copiarlo si se necesita conservarlo.
         """
-        x1, v1, x2, v2 = y
-        
-        # Fuerzas en masa 1
-        # Fuerza del resorte 1 (hacia arriba si estirado)
-        F_resorte1 = -self.k1 * (x1 - self.L1)
-        # Fuerza del resorte 2 (hacia abajo si x2 > x1 + L2)
-        F_resorte2 = self.k2 * (x2 - x1 - self.L2)
-        # Fuerza gravitacional (hacia abajo)
-        F_gravedad1 = self.m1 * self.g
-        
-        # Aceleración masa 1
-        a1 = (F_resorte1 + F_resorte2 + F_gravedad1) / self.m1
-        
-        # Fuerzas en masa 2
-        # Fuerza del resorte 2 (hacia arriba si se comprime)
-        F_resorte2_m2 = -self.k2 * (x2 - x1 - self.L2)
-        # Fuerza gravitacional (hacia abajo)
-        F_gravedad2 = self.m2 * self.g
-        
-        # Aceleración masa 2
-        a2 = (F_resorte2_m2 + F_gravedad2) / self.m2
+        return _ecuaciones_rhs(np.ascontiguousarray(y, dtype=float), t,
+                               *self._constantes, self._dydt)
+    
+    def _jacobiano(self, y, t, *args):
+        """
+        Jacobiano analítico d(dydt)/dy para ``odeint``.
         
-        return [v1, a1, v2, a2]
+        Recibe los mismos ``args`` que el lado derecho aunque no los usa,
+        ya que el Jacobiano se precalcula en ``_precalcular``.
+        """
+        return self._J
     
     def encontrar_equilibrio(self):
         """
@@ -121,7 +471,99 @@ class SistemaMasaResorte:
         
         return x1_eq, x2_eq
     
-    def simular(self, condiciones_iniciales, t_inicial=0, t_final=10, num_puntos=1000):
+    def frecuencias_naturales(self):
+        """
+        Calcula las frecuencias naturales del sistema sin integrar.
+        
+        Son las raíces de los valores propios del problema generalizado
+        K v = w² M v, resuelto al construir el sistema o al cambiar
+        alguno de sus parámetros.
+        
+        Returns
+        -------
+        array
+            (w1, w2): frecuencias angulares de los modos normales (rad/s),
+            en orden creciente
+        """
+        return self._omega.copy()
+    
+    def _puntos_automaticos(self, t_inicial, t_final, puntos_por_periodo=50):
+        """
+        Número de puntos que resuelve el modo más rápido con
+        ``puntos_por_periodo`` muestras por periodo.
+        """
+        periodo_min = 2 * np.pi / self._omega[-1]
+        return int(np.ceil(puntos_por_periodo * (t_final - t_inicial) / periodo_min)) + 1
+    
+    def _solucion_analitica(self, condiciones_iniciales, t):
+        """
+        Evalúa la solución exacta como superposición de los modos normales.
+        
+        Las desviaciones respecto al equilibrio se proyectan sobre las
+        coordenadas modales q = V.T @ M @ (x - x_eq), cada una de las cuales
+        oscila como q(t) = q0 cos(w t) + (q0'/w) sin(w t).
+        
+        Returns
+        -------
+        array
+            Matriz (len(t), 4) con columnas [x1, v1, x2, v2]
+        """
+        x1_0, v1_0, x2_0, v2_0 = condiciones_iniciales
+        x_eq = np.array(self.encontrar_equilibrio())
+        
+        proyeccion = self._V.T @ self._M
+        q0 = proyeccion @ (np.array([x1_0, x2_0]) - x_eq)
+        dq0 = proyeccion @ np.array([v1_0, v2_0])
+        
+        omega = self._omega[:, None]
+        fase = omega * (t - t[0])
+        cos_fase = np.cos(fase)
+        sen_fase = np.sin(fase)
+        
+        q = q0[:, None] * cos_fase + (dq0[:, None] / omega) * sen_fase
+        dq = -q0[:, None] * omega * sen_fase + dq0[:, None] * cos_fase
+        
+        x = self._V @ q + x_eq[:, None]
+        v = self._V @ dq
+        
+        solucion = np.empty((len(t), 4))
+        solucion[:, 0] = x[0]
+        solucion[:, 1] = v[0]
+        solucion[:, 2] = x[1]
+        solucion[:, 3] = v[1]
+        return solucion
+    
+    def _integrar_dopri5(self, condiciones_iniciales, t, rtol, atol, mxstep):
+        """
+        Integra con Dormand-Prince 5(4) de ``scipy.integrate.ode``.
+        
+        Para este oscilador no rígido evita la lógica de detección de
+        rigidez de LSODA. Los resultados se escriben en una matriz
+        preasignada (len(t), 4).
+        """
+        constantes = self._constantes
+        dydt = self._dydt
+        
+        def f(t_actual, y):
+            return _ecuaciones_rhs(y, t_actual, *constantes, dydt)
+        
+        solver = ode(f).set_integrator('dopri5', rtol=rtol, atol=atol,
+                                       nsteps=mxstep)
+        solver.set_initial_value(condiciones_iniciales, t[0])
+        
+        solucion = np.empty((len(t), 4))
+        solucion[0] = condiciones_iniciales
+        for i in range(1, len(t)):
+            solucion[i] = solver.integrate(t[i])
+            if not solver.successful():
+                raise RuntimeError(
+                    f"dopri5 falló en t = {t[i]:.4g} s; "
+                    "considere aumentar mxstep o relajar rtol/atol")
+        return solucion
+    
+    def simular(self, condiciones_iniciales, t_inicial=0, t_final=10, num_puntos=1000,
+                metodo='lsoda', rtol=1e-8, atol=1e-10, mxstep=5000,
+                dtype=np.float64):
         """
         Simula el sistema usando condiciones iniciales.
         
@@ -133,25 +575,135 @@ class SistemaMasaResorte:
             Tiempo inicial (default: 0)
         t_final : float, optional
             Tiempo final (default: 10 segundos)
-        num_puntos : int, optional
-            Número de puntos de evaluación (default: 1000)
+        num_puntos : int or None, optional
+            Número de puntos de evaluación (default: 1000). Con None se
+            elige a partir de la frecuencia natural más alta, con 50
+            puntos por periodo del modo más rápido
+        metodo : str, optional
+            'lsoda' integra numéricamente con odeint (default);
+            'analitico' evalúa la solución exacta por modos normales
+            sin usar un integrador; 'verlet' usa Velocity-Verlet con paso
+            fijo igual a la separación entre puntos, por lo que su precisión
+            depende de num_puntos; 'dopri5' usa Runge-Kutta 5(4) de paso
+            adaptativo, pensado para sistemas no rígidos como este
+        rtol, atol : float, optional
+            Tolerancias relativa y absoluta de 'lsoda' y 'dopri5'
+            (default: 1e-8 y 1e-10)
+        mxstep : int, optional
+            Máximo de pasos internos entre dos puntos de salida para
+            'lsoda' y 'dopri5' (default: 5000)
+        dtype : data-type, optional
+            Tipo de los datos devueltos (default: np.float64). Con
+            np.float32 la solución ocupa la mitad de memoria; la
+            integración se hace siempre en doble precisión y solo se
+            convierte el resultado
             
         Returns
         -------
-        tuple
-            (t, x1, v1, x2, v2) - arrays de tiempo y soluciones
+        ResultadoSimulacion
+            (t, solucion) - array de tiempos y matriz (len(t), 4) con
+            [x1, v1, x2, v2]; también accesibles como .x1, .v1, .x2, .v2
         """
+        if num_puntos is None:
+            num_puntos = self._puntos_automaticos(t_inicial, t_final)
+        if num_puntos < 1:
+            raise ValueError("num_puntos debe ser al menos 1")
         t = np.linspace(t_inicial, t_final, num_puntos)
-        solucion = odeint(self.ecuaciones, condiciones_iniciales, t)
         
-        x1 = solucion[:, 0]
-        v1 = solucion[:, 1]
-        x2 = solucion[:, 2]
-        v2 = solucion[:, 3]
+        if metodo == 'lsoda':
+            solucion = odeint(_ecuaciones_rhs, condiciones_iniciales, t,
+                              args=self._constantes + (self._dydt,),
+                              Dfun=self._jacobiano, col_deriv=False,
+                              rtol=rtol, atol=atol, mxstep=mxstep)
+        elif metodo == 'dopri5':
+            solucion = self._integrar_dopri5(condiciones_iniciales, t,
+                                             rtol, atol, mxstep)
+        elif metodo == 'analitico':
+            solucion = self._solucion_analitica(condiciones_iniciales, t)
+        elif metodo == 'verlet':
+            y0 = np.asarray(condiciones_iniciales, dtype=float)
+            solucion = np.empty((num_puntos, 4))
+            if _libecuaciones is not None:
+                _verlet_c(y0, t, self._constantes, solucion)
+            else:
+                _verlet(y0, t, *self._constantes, solucion)
+        else:
+            raise ValueError(f"Método desconocido: {metodo!r}")
         
-        return t, x1, v1, x2, v2
+        return ResultadoSimulacion(t, solucion.astype(dtype, copy=False))
     
-    def graficar_resultado(self, t, x1, v1, x2, v2, x1_eq=None, x2_eq=None):
+    def _jacobiano_bandas_batch(self, n_sistemas):
+        """
+        Jacobiano del sistema concatenado en el formato de bandas de odeint.
+        
+        Es diagonal por bloques (un bloque ``_J`` por sistema), así que cabe
+        en 3 subdiagonales y 3 superdiagonales: la fila ``r`` guarda la
+        diagonal ``r - 3``, con ``bandas[i - j + 3, j] = dfi/dyj``.
+        """
+        bandas = np.zeros((7, 4))
+        for r in range(7):
+            for c in range(4):
+                fila = c + r - 3
+                if 0 <= fila < 4:
+                    bandas[r, c] = self._J[fila, c]
+        return np.tile(bandas, (1, n_sistemas))
+    
+    def simular_batch(self, condiciones_iniciales, t_inicial=0, t_final=10, num_puntos=1000,
+                      rtol=1e-8, atol=1e-10, mxstep=5000, dtype=np.float64):
+        """
+        Simula varias condiciones iniciales en una sola llamada a odeint.
+        
+        Los N sistemas son independientes y comparten parámetros, así que se
+        concatenan en un único vector de estado de longitud 4N. Esto reparte
+        el costo fijo de cada llamada al integrador entre todos ellos, en
+        lugar de llamar a ``simular`` N veces.
+        
+        Parameters
+        ----------
+        condiciones_iniciales : array
+            Matriz (N, 4) con filas (x1_0, v1_0, x2_0, v2_0)
+        t_inicial : float, optional
+            Tiempo inicial (default: 0)
+        t_final : float, optional
+            Tiempo final (default: 10 segundos)
+        num_puntos : int or None, optional
+            Número de puntos de evaluación (default: 1000). Con None se
+            elige como en ``simular``
+        rtol, atol : float, optional
+            Tolerancias relativa y absoluta (default: 1e-8 y 1e-10)
+        mxstep : int, optional
+            Máximo de pasos internos entre dos puntos de salida
+            (default: 5000)
+        dtype : data-type, optional
+            Tipo de los datos devueltos, como en ``simular``
+            (default: np.float64)
+            
+        Returns
+        -------
+        tuple
+            (t, solucion) - array de tiempos y array (num_puntos, N, 4) con
+            [x1, v1, x2, v2] de cada sistema
+        """
+        ics = np.asarray(condiciones_iniciales, dtype=float)
+        if ics.ndim != 2 or ics.shape[1] != 4 or ics.shape[0] == 0:
+            raise ValueError("condiciones_iniciales debe tener forma (N, 4) con N > 0")
+        n_sistemas = ics.shape[0]
+        
+        if num_puntos is None:
+            num_puntos = self._puntos_automaticos(t_inicial, t_final)
+        t = np.linspace(t_inicial, t_final, num_puntos)
+        bandas = self._jacobiano_bandas_batch(n_sistemas)
+        solucion = odeint(_ecuaciones_batch_jit, ics.ravel(), t,
+                          args=self._constantes + (np.empty(4 * n_sistemas),),
+                          Dfun=lambda y, t_actual, *args: bandas,
+                          col_deriv=False, ml=3, mu=3,
+                          rtol=rtol, atol=atol, mxstep=mxstep)
+        
+        solucion = solucion.reshape(num_puntos, n_sistemas, 4)
+        return t, solucion.astype(dtype, copy=False)
+    
+    def graficar_resultado(self, t, x1, v1, x2, v2, x1_eq=None, x2_eq=None,
+                           fig=None, max_puntos=2000):
         """
         Grafica los resultados de la simulación.
         
@@ -163,8 +715,24 @@ class SistemaMasaResorte:
             Posiciones y velocidades
         x1_eq, x2_eq : float, optional
             Posiciones de equilibrio para referencia
+        fig : Figure, optional
+            Figura a reutilizar (se limpia antes de graficar); si no se
+            da, se crea una nueva
+        max_puntos : int, optional
+            Máximo de puntos por curva, al menos 2; las series más largas
+            se submuestrean antes de graficar (default: 2000)
         """
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        if max_puntos < 2:
+            raise ValueError("max_puntos debe ser al menos 2")
+        
+        if fig is None:
+            fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        else:
+            fig.clf()
+            axes = fig.subplots(2, 2)
+        
+        t, x1, v1, x2, v2 = _submuestrear(t, x1, v1, x2, v2,
+                                          max_puntos=max_puntos)
         
         # Posición masa 1
         axes[0, 0].plot(t, x1, 'b-', linewidth=2, label='Masa 1')
@@ -204,7 +772,7 @@ class SistemaMasaResorte:
         axes[1, 1].set_title('Velocidad de Masa 2')
         axes[1, 1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
 
@@ -254,7 +822,7 @@ if __name__ == "__main__":
     
     # Simular
     print(f"\nSimulando durante 10 segundos...")
-    t, x1, v1, x2, v2 = sistema.simular(
+    resultado = sistema.simular(
         (x1_0, v1_0, x2_0, v2_0),
         t_inicial=0,
         t_final=10,
@@ -264,8 +832,12 @@ if __name__ == "__main__":
     
     # Graficar
     print("\nGenerando gráficos...")
-    fig = sistema.graficar_resultado(t, x1, v1, x2, v2, x1_eq, x2_eq)
-    plt.savefig('simulacion_masa_resorte.png', dpi=150, bbox_inches='tight')
+    fig = sistema.graficar_resultado(resultado.t, resultado.x1, resultado.v1,
+                                     resultado.x2, resultado.v2, x1_eq, x2_eq)
+    # tight_layout() ya ajustó los márgenes; bbox_inches='tight' obligaría
+    # a renderizar la figura dos veces
+    fig.savefig('simulacion_masa_resorte.png', dpi=100)
     print("✓ Gráficos guardados en 'simulacion_masa_resorte.png'")
     
-    plt.show()
+    if not _SIN_PANTALLA:
+        plt.show()
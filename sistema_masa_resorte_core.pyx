@@ -0,0 +1,32 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Lado derecho del sistema de EDOs compilado con Cython.
+
+Alternativa a Numba para entornos donde no está disponible. Compilar con:
+
+    cythonize -i sistema_masa_resorte_core.pyx
+
+``sistema_masa_resorte`` lo usa automáticamente si el módulo compilado
+puede importarse.
+"""
+
+
+cpdef ecuaciones_c(const double[::1] y, double t, double k1, double k2,
+                   double L1, double L2, double peso1, double peso2,
+                   double inv_m1, double inv_m2, out):
+    """
+    Misma interfaz que ``_ecuaciones_jit``: escribe [v1, a1, v2, a2]
+    en ``out`` y lo devuelve.
+    """
+    cdef double[::1] dydt = out
+    cdef double x1 = y[0]
+    cdef double x2 = y[2]
+    
+    # Fuerza del resorte 2 sobre la masa 1; sobre la masa 2 es la opuesta
+    cdef double acoplamiento = k2 * (x2 - x1 - L2)
+    
+    dydt[0] = y[1]
+    dydt[1] = (-k1 * (x1 - L1) + acoplamiento + peso1) * inv_m1
+    dydt[2] = y[3]
+    dydt[3] = (-acoplamiento + peso2) * inv_m2
+    return out